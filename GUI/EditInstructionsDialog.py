@@ -1,6 +1,7 @@
 import logging
 logging.basicConfig(encoding='utf-8')
 import os
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QStyle, 
     QApplication, 
@@ -9,8 +10,7 @@ from PySide6.QtWidgets import (
     QVBoxLayout, 
     QHBoxLayout, 
     QPushButton, 
-    QFileDialog,
-    QSizePolicy
+    QFileDialog
     )
 from GUI.GuiHelpers import GetResourcePath
 from GUI.Widgets.OptionsWidgets import MULTILINE_OPTION, CreateOptionWidget
@@ -51,7 +51,6 @@ class EditInstructionsDialog(QDialog):
             initial_value = initial_value.replace('\r\n', '\n')
 
         input = CreateOptionWidget(key, initial_value, key_type, tooltip)
-        input.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
         self.form_layout.addRow(key, input)
         return input
 
@@ -62,10 +61,17 @@ class EditInstructionsDialog(QDialog):
         return button
 
     def accept(self):
-        if self._check_for_edited_instructions():
-            self.instructions.prompt = self.prompt_edit.GetValue()
-            self.instructions.instructions = self.instructions_edit.GetValue()
-            self.instructions.retry_instructions = self.retry_instructions_edit.GetValue()
+        prompt = self.prompt_edit.GetValue()
+        instructions = self.instructions_edit.GetValue()
+        retry_instructions = self.retry_instructions_edit.GetValue()
+
+        # Only update the instructions if they have been edited
+        if (prompt != self.instructions.prompt
+            or instructions != self.instructions.instructions
+            or retry_instructions != self.instructions.retry_instructions):
+            self.instructions.prompt = prompt
+            self.instructions.instructions = instructions
+            self.instructions.retry_instructions = retry_instructions
             self.instructions.instruction_file = None
 
         super().accept()
@@ -73,17 +79,6 @@ class EditInstructionsDialog(QDialog):
     def reject(self):
         super().reject()
 
-    def _check_for_edited_instructions(self):
-        '''Check if the instructions have been edited'''
-        if self.prompt_edit.GetValue() != self.instructions.prompt:
-            return True
-        if self.instructions_edit.GetValue() != self.instructions.instructions:
-            return True
-        if self.retry_instructions_edit.GetValue() != self.instructions.retry_instructions:
-            return True
-        
-        return False
-
     @property
     def load_icon(self):
         return QApplication.style().standardIcon(QStyle.StandardPixmap.SP_DialogOpenButton)
@@ -94,8 +89,14 @@ class EditInstructionsDialog(QDialog):
     
     def _load_instructions(self):
         '''Load instructions from a file'''
-        options = QFileDialog.Options()
-        file_name, _ = QFileDialog.getOpenFileName(self, "Load Instructions", "", "Text Files (*.txt);;All Files (*)", options=options)
+        dialog = QFileDialog(self, "Load Instructions", "", "Text Files (*.txt);;All Files (*)")
+        dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+        dialog.fileSelected.connect(self._on_load_file_selected)
+        dialog.open()
+
+    def _on_load_file_selected(self, file_name):
         if file_name:
             try:
                 self.instructions.LoadInstructionsFile(file_name)
@@ -109,9 +110,15 @@ class EditInstructionsDialog(QDialog):
 
     def _save_instructions(self):
         '''Save instructions to a file'''
-        options = QFileDialog.Options()
         filepath = GetResourcePath(self.instructions.instruction_file)
-        file_name, _ = QFileDialog.getSaveFileName(self, "Save Instructions", filepath, "Text Files (*.txt);;All Files (*)", options=options)
+        dialog = QFileDialog(self, "Save Instructions", filepath, "Text Files (*.txt);;All Files (*)")
+        dialog.setFileMode(QFileDialog.FileMode.AnyFile)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+        dialog.fileSelected.connect(self._on_save_file_selected)
+        dialog.open()
+
+    def _on_save_file_selected(self, file_name):
         if file_name:
             try:
                 self.instructions.prompt = self.prompt_edit.GetValue()
@@ -1,4 +1,5 @@
 from datetime import timedelta
+from functools import lru_cache
 import logging
 logging.basicConfig(encoding='utf-8')
 import os
@@ -37,6 +38,18 @@ def LoadInstructionsResource(resource_name):
     instructions.LoadInstructionsFile(filepath)
     return instructions
 
+@lru_cache(maxsize=32)
+def _cached_instructions(resource_name, mtime):
+    return LoadInstructionsResource(resource_name)
+
+def GetInstructionsResource(resource_name):
+    """
+    Load instructions from a resource file, re-using the parsed result if the file has not been modified.
+    The returned instructions are shared, so they should not be modified.
+    """
+    mtime = os.stat(GetResourcePath(resource_name)).st_mtime
+    return _cached_instructions(resource_name, mtime)
+
 def GetLineHeight(text: str, wrap_length: int = 100) -> int:
     """
     Calculate the number of lines for a given text with wrapping and newline characters.
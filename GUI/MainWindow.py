@@ -2,9 +2,8 @@ import os
 import logging
 logging.basicConfig(encoding='utf-8')
 import dotenv
-import darkdetect
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, Signal, Slot
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QApplication,
@@ -14,47 +13,126 @@ from PySide6.QtWidgets import (
     QSplitter,
     QDialog
 )
-from GUI.AboutDialog import AboutDialog
 from GUI.Command import Command
 from GUI.CommandQueue import ClearCommandQueue, CommandQueue
 from GUI.FileCommands import LoadSubtitleFile
-from GUI.FirstRunOptions import FirstRunOptions
 from GUI.GUICommands import ExitProgramCommand
 from GUI.GuiHelpers import GetResourcePath
 from GUI.MainToolbar import MainToolbar
-from GUI.SettingsDialog import SettingsDialog
 from GUI.ProjectActions import NoApiKeyError, ProjectActions
 from GUI.ProjectCommands import BatchSubtitlesCommand
 from GUI.ProjectDataModel import ProjectDataModel
 from GUI.Widgets.LogWindow import LogWindow
 from GUI.Widgets.ModelView import ModelView
-from GUI.NewProjectSettings import NewProjectSettings
 from PySubtitle.Options import Options
-from PySubtitle.SubtitleProject import SubtitleProject
-from PySubtitle.VersionCheck import CheckIfUpdateAvailable, CheckIfUpdateCheckIsRequired
 from PySubtitle.version import __version__
 
 # Load environment variables from .env file
 dotenv.load_dotenv()
 
-def LoadStylesheet(name):
+# Resolved paths for the bundled themes and icons
+_THEME_PATHS = { name: GetResourcePath(os.path.join("theme", f"{name}.qss")) for name in ("subtrans", "subtrans-dark") }
+_ICON_PATHS = { name: GetResourcePath(f"{name}.ico") for name in ("subtrans64", "gui-subtrans") }
+
+# Stylesheet text keyed by filepath, with the modification time it was read at
+_STYLESHEET_CACHE : dict[str, tuple[float, str]] = {}
+
+# Whether the system is using a dark theme, detected on first use
+_IS_DARK = None
+
+def IsDarkMode():
+    global _IS_DARK
+    if _IS_DARK is None:
+        try:
+            import darkdetect
+            _IS_DARK = bool(darkdetect.isDark())
+        except Exception as e:
+            logging.debug(f"Unable to detect system theme: {str(e)}")
+            _IS_DARK = False
+
+    return _IS_DARK
+
+def InvalidateThemeCache():
+    """
+    Detect the system theme again next time it is needed
+    """
+    global _IS_DARK
+    _IS_DARK = None
+
+def GetStylesheetPath(name):
     if not name or name == "default":
-        name = "subtrans-dark" if darkdetect.isDark() else "subtrans"
+        name = "subtrans-dark" if IsDarkMode() else "subtrans"
+
+    filepath = _THEME_PATHS.get(name)
+    if not filepath:
+        filepath = _THEME_PATHS[name] = GetResourcePath(os.path.join("theme", f"{name}.qss"))
+
+    return filepath
+
+def ReadStylesheet(filepath):
+    """
+    Read a stylesheet from disk, unless the cached copy is still current
+    """
+    mtime = os.stat(filepath).st_mtime
+    cached = _STYLESHEET_CACHE.get(filepath)
+    if cached and cached[0] == mtime:
+        return cached[1]
 
-    filepath = GetResourcePath(os.path.join("theme", f"{name}.qss"))
     logging.info(f"Loading stylesheet from {filepath}")
     with open(filepath, 'r') as file:
         stylesheet = file.read()
+
+    _STYLESHEET_CACHE[filepath] = (mtime, stylesheet)
+    return stylesheet
+
+def LoadStylesheet(name):
+    filepath = GetStylesheetPath(name)
+    stylesheet = ReadStylesheet(filepath)
     QApplication.instance().setStyleSheet(stylesheet)
     return stylesheet
 
+class StylesheetLoader(QRunnable, QObject):
+    """
+    Read a stylesheet on a worker thread and signal when it is ready
+    """
+    stylesheetLoaded = Signal(str)
+
+    def __init__(self, name):
+        QRunnable.__init__(self)
+        QObject.__init__(self)
+        self.filepath = GetStylesheetPath(name)
+
+    @Slot()
+    def run(self):
+        try:
+            stylesheet = ReadStylesheet(self.filepath)
+            self.stylesheetLoaded.emit(stylesheet)
+
+        except Exception as e:
+            logging.error(f"Unable to load stylesheet from {self.filepath}: {str(e)}")
+
+class UpdateChecker(QRunnable, QObject):
+    """
+    Check for a newer release on a worker thread and signal the result
+    """
+    updateCheckComplete = Signal(bool)
+
+    def __init__(self):
+        QRunnable.__init__(self)
+        QObject.__init__(self)
+
+    @Slot()
+    def run(self):
+        from PySubtitle.VersionCheck import CheckIfUpdateAvailable
+        update_available = CheckIfUpdateAvailable()
+        self.updateCheckComplete.emit(update_available)
+
 class MainWindow(QMainWindow):
     def __init__(self, parent=None, options : Options = None, filepath : str = None):
         super().__init__(parent)
 
         self.setWindowTitle("GUI-Subtrans")
         self.setGeometry(100, 100, 1600, 900)
-        self._load_icon("gui-subtrans")
 
         if not options:
             options = Options()
@@ -63,11 +141,13 @@ class MainWindow(QMainWindow):
 
         self.options = options
 
-        theme = options.get('theme', 'default')
-        LoadStylesheet(theme)
+        # Apply the icon and stylesheet once the event loop is running, so the window can be shown first
+        self._pending_theme = options.get('theme', 'default')
+        QTimer.singleShot(0, self._apply_theme)
 
         # Create the project data model
         self.datamodel = ProjectDataModel(options=options)
+        self.datamodel.PrefetchAvailableModels()
 
         # Create the command queue
         self.command_queue = CommandQueue(self)
@@ -123,8 +203,11 @@ class MainWindow(QMainWindow):
         logging.info(f"GPT-Subtrans {__version__}")
 
         # Check if there is a more recent version on Github (TODO: make this optional)
+        from PySubtitle.VersionCheck import CheckIfUpdateCheckIsRequired
         if CheckIfUpdateCheckIsRequired():
-            CheckIfUpdateAvailable()
+            self.update_checker = UpdateChecker()
+            self.update_checker.updateCheckComplete.connect(self._on_update_check_complete)
+            QThreadPool.globalInstance().start(self.update_checker)
 
         self.statusBar().showMessage("Ready.")
 
@@ -139,6 +222,7 @@ class MainWindow(QMainWindow):
         Open user settings dialog and update options
         """
         options = self.options
+        from GUI.SettingsDialog import SettingsDialog
         settings = options.GetSettings()
         result = SettingsDialog(settings, self).exec()
 
@@ -151,6 +235,7 @@ class MainWindow(QMainWindow):
             logging.info("Settings updated")
 
     def ShowAboutDialog(self):
+        from GUI.AboutDialog import AboutDialog
         _ = AboutDialog(self).exec()
 
     def PrepareForSave(self):
@@ -165,18 +250,32 @@ class MainWindow(QMainWindow):
 
         self.PrepareForSave()
 
-        project = self.datamodel.project
-        if project and project.subtitles:
-            project.UpdateProjectFile()
+        # Write any pending changes, skipping the save if nothing has changed
+        if self.datamodel and self.datamodel.NeedsAutosave():
+            self.datamodel.SaveProject()
 
         super().closeEvent(e)
 
+    def _apply_theme(self):
+        self._load_icon("gui-subtrans")
+
+        # Read the stylesheet in the background so the window isn't blocked on disk I/O
+        self.stylesheet_loader = StylesheetLoader(self._pending_theme)
+        self.stylesheet_loader.stylesheetLoaded.connect(QApplication.instance().setStyleSheet)
+        QThreadPool.globalInstance().start(self.stylesheet_loader)
+
     def _load_icon(self, name):
         if not name or name == "default":
             name = "subtrans64"
-        filepath = GetResourcePath(f"{name}.ico")
+        filepath = _ICON_PATHS.get(name)
+        if not filepath:
+            filepath = _ICON_PATHS[name] = GetResourcePath(f"{name}.ico")
         self.setWindowIcon(QIcon(filepath))
 
+    def _on_update_check_complete(self, update_available : bool):
+        if update_available:
+            self.statusBar().showMessage("A new version of GPT-Subtrans is available.")
+
     def _on_action_requested(self, action_name, params):
         if not self.datamodel:
             raise Exception(f"Cannot perform {action_name} without a data model")
@@ -202,18 +301,17 @@ class MainWindow(QMainWindow):
         logging.debug(f"A {type(command).__name__} command {'succeeded' if success else 'failed'})")
 
         if success:
-            if isinstance(command, LoadSubtitleFile):
-                self.datamodel = command.datamodel
-                self.model_viewer.SetDataModel(command.datamodel)
-                if not self.datamodel.IsProjectInitialised():
-                    self._show_new_project_Settings(self.datamodel.project)
-
             if command.model_update.HasUpdate():
                 self.datamodel.UpdateViewModel(command.model_update)
 
+            elif command.datamodel is self.datamodel and not self.datamodel.viewmodel_changed:
+                # Nothing to rebuild, the view is already bound to the current viewmodel
+                self.model_viewer.show()
+
             elif command.datamodel:
-                # Shouldn't need to do a full model rebuild often? 
+                # Full rebuild when the datamodel or its viewmodel has been replaced
                 self.datamodel = command.datamodel
+                self.datamodel.viewmodel_changed = False
                 self.action_handler.SetDataModel(self.datamodel)
                 self.model_viewer.SetDataModel(self.datamodel)
                 self.model_viewer.show()
@@ -221,6 +319,9 @@ class MainWindow(QMainWindow):
             else:
                 self.model_viewer.hide()
 
+            if isinstance(command, LoadSubtitleFile) and not self.datamodel.IsProjectInitialised():
+                self._show_new_project_Settings(self.datamodel)
+
         # Auto-save if the commmand queue is empty and the project has changed
         if self.datamodel and self.datamodel.NeedsAutosave():
             if not self.command_queue.AnyCommands():
@@ -260,6 +361,7 @@ class MainWindow(QMainWindow):
             self.datamodel.UpdateSettings(options)
 
     def _first_run(self, options: Options):
+        from GUI.FirstRunOptions import FirstRunOptions
         settings = options.GetSettings()
         result = FirstRunOptions(settings, self).exec()
 
@@ -271,12 +373,13 @@ class MainWindow(QMainWindow):
             self.options = options
             LoadStylesheet(options.get('theme'))
 
-    def _show_new_project_Settings(self, project : SubtitleProject):
-        result = NewProjectSettings(project, self).exec()
+    def _show_new_project_Settings(self, datamodel : ProjectDataModel):
+        from GUI.NewProjectSettings import NewProjectSettings
+        result = NewProjectSettings(datamodel, self).exec()
 
         if result == QDialog.Accepted:
             logging.info("Project settings set")
-            self.QueueCommand(BatchSubtitlesCommand(project))
+            self.QueueCommand(BatchSubtitlesCommand(datamodel.project))
 
     def _on_error(self, error : object):
         logging.error(str(error))
@@ -1,13 +1,14 @@
 import logging
 logging.basicConfig(encoding='utf-8')
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QDialogButtonBox, QFormLayout, QFrame, QLabel)
-from GUI.GuiHelpers import GetInstructionFiles, LoadInstructionsResource
+from GUI.GuiHelpers import GetInstructionFiles, GetInstructionsResource
 
+from GUI.ProjectDataModel import ProjectDataModel
 from GUI.Widgets.OptionsWidgets import CreateOptionWidget
 from PySubtitle import SubtitleProject
 from PySubtitle.SubtitleBatcher import CreateSubtitleBatcher
 from PySubtitle.SubtitleScene import SubtitleScene
-from PySubtitle.SubtitleTranslator import SubtitleTranslator
 
 class NewProjectSettings(QDialog):
     SETTINGS = {
@@ -22,22 +23,30 @@ class NewProjectSettings(QDialog):
         'instruction_file': (str, "Detailed instructions for the translator")
     }
 
-    def __init__(self, project : SubtitleProject, parent=None):
+    # Settings that affect how the subtitles are batched
+    BATCHING_KEYS = ('min_batch_size', 'max_batch_size', 'scene_threshold', 'use_simple_batcher', 'batch_threshold')
+
+    def __init__(self, datamodel : ProjectDataModel, parent=None):
         super(NewProjectSettings, self).__init__(parent)
         self.setWindowTitle("Project Settings")
         self.setMinimumWidth(800)
 
         self.fields = {}
+        self.preview_settings = None
+        self.preview_cache = {}
 
-        self.project : SubtitleProject = project
-        self.settings : dict = project.options.GetSettings()
-        self.settings['model'] = self.settings.get('model') or self.settings.get('gpt_model')
+        # Coalesce rapid edits into a single batch preview
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(150)
+        self.preview_timer.timeout.connect(self._preview_batches)
 
-        api_key = project.options.api_key()
-        api_base = project.options.api_base()
+        self.project : SubtitleProject = datamodel.project
+        self.settings : dict = self.project.options.GetSettings()
+        self.settings['model'] = self.settings.get('model') or self.settings.get('gpt_model')
 
-        if api_key:
-            models = SubtitleTranslator.GetAvailableModels(api_key, api_base)
+        if self.project.options.api_key():
+            models = datamodel.GetAvailableModels()
             self.SETTINGS['model'] = (models, self.SETTINGS['model'][1])
 
         instruction_files = GetInstructionFiles()
@@ -52,7 +61,8 @@ class NewProjectSettings(QDialog):
         for key, setting in self.SETTINGS.items():
             key_type, tooltip = setting
             field = CreateOptionWidget(key, self.settings[key], key_type, tooltip=tooltip)
-            field.contentChanged.connect(self._preview_batches)
+            if key in self.BATCHING_KEYS:
+                field.contentChanged.connect(self._schedule_preview)
             self.form_layout.addRow(field.name, field)
             self.fields[key] = field
 
@@ -78,7 +88,7 @@ class NewProjectSettings(QDialog):
             if instructions_file:
                 logging.info(f"Project instructions set from {instructions_file}")
                 try:
-                    instructions = LoadInstructionsResource(instructions_file)
+                    instructions = GetInstructionsResource(instructions_file)
 
                     self.settings['prompt'] = instructions.prompt
                     self.settings['instructions'] = instructions.instructions
@@ -100,38 +110,47 @@ class NewProjectSettings(QDialog):
         super(NewProjectSettings, self).accept()
 
     def _update_settings(self):
-        layout = self.form_layout.layout()
+        for key, field in self.fields.items():
+            self.settings[key] = field.GetValue()
 
-        for row in range(layout.rowCount()):
-            field = layout.itemAt(row, QFormLayout.FieldRole).widget()
-            self.settings[field.key] = field.GetValue()
+    def _schedule_preview(self):
+        self.preview_timer.start()
 
     def _preview_batches(self):
         self._update_settings()
         self._update_inputs()
 
+        preview_settings = tuple(self.settings.get(key) for key in self.BATCHING_KEYS)
+        if preview_settings == self.preview_settings:
+            return
+
+        self.preview_settings = preview_settings
+
+        originals = self.project.subtitles.originals
+        cache_key = (*preview_settings, id(originals))
+        if cache_key in self.preview_cache:
+            self.preview_widget.setText(self.preview_cache[cache_key])
+            return
+
         batcher = CreateSubtitleBatcher(self.settings)
         if batcher.min_batch_size < batcher.max_batch_size:
-            scenes : list[SubtitleScene] = batcher.BatchSubtitles(self.project.subtitles.originals)
+            scenes : list[SubtitleScene] = batcher.BatchSubtitles(originals)
             batch_count = sum(scene.size for scene in scenes)
             line_count = sum(scene.linecount for scene in scenes)
-            self.preview_widget.setText(f"{line_count} lines in {len(scenes)} scenes and {batch_count} batches")
+            preview_text = f"{line_count} lines in {len(scenes)} scenes and {batch_count} batches"
+            self.preview_cache[cache_key] = preview_text
+            self.preview_widget.setText(preview_text)
 
     def _update_inputs(self):
-        layout : QFormLayout = self.form_layout.layout()
-
-        for row in range(layout.rowCount()):
-            field = layout.itemAt(row, QFormLayout.ItemRole.FieldRole).widget()
-            if field.key == 'batch_threshold':
-                use_simple_batcher = self.settings.get('use_simple_batcher')
-                field.setEnabled(use_simple_batcher)
+        use_simple_batcher = self.settings.get('use_simple_batcher')
+        self.fields['batch_threshold'].setEnabled(use_simple_batcher)
 
     def _update_instruction_file(self):
         """ Update the prompt when the instruction file is changed """
         instruction_file = self.fields['instruction_file'].GetValue()
         if instruction_file:
             try:
-                instructions = LoadInstructionsResource(instruction_file)
+                instructions = GetInstructionsResource(instruction_file)
                 self.fields['gpt_prompt'].SetValue(instructions.prompt)
             except Exception as e:
                 logging.error(f"Unable to load instructions from {instruction_file}: {e}")
@@ -1,8 +1,17 @@
-from PySide6.QtCore import QMutex, QMutexLocker
+import hashlib
+from PySide6.QtCore import QMutex, QMutexLocker, QThreadPool
 from GUI.ProjectViewModel import ProjectViewModel
 from GUI.ProjectViewModelUpdate import ModelUpdate
 from PySubtitle.Options import Options
 from PySubtitle.SubtitleProject import SubtitleProject
+from PySubtitle.SubtitleTranslator import SubtitleTranslator
+
+# Available models, keyed by a truncated hash of the API key and the API base
+_available_models : dict[tuple[str, str], list[str]] = {}
+_available_models_mutex = QMutex()
+
+def _available_models_key(api_key : str, api_base : str):
+    return (hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16], api_base)
 
 class ProjectDataModel:
     _action_handlers = {}
@@ -10,6 +19,7 @@ class ProjectDataModel:
     def __init__(self, project = None, options = None):
         self.project : SubtitleProject = project
         self.viewmodel : ProjectViewModel = None
+        self.viewmodel_changed : bool = False
         self.options = options or Options()
         self.mutex = QMutex()
 
@@ -38,6 +48,38 @@ class ProjectDataModel:
         if self.NeedsSave():
             self.project.WriteProjectFile()
 
+    @property
+    def available_models(self):
+        """Models available with the current API settings, or None if they have not been retrieved yet"""
+        api_key = self.options.api_key()
+        if not api_key:
+            return None
+
+        with QMutexLocker(_available_models_mutex):
+            return _available_models.get(_available_models_key(api_key, self.options.api_base()))
+
+    def PrefetchAvailableModels(self):
+        """Retrieve the available models on a background thread so they are ready when needed"""
+        api_key = self.options.api_key()
+        api_base = self.options.api_base()
+        if api_key and self.available_models is None:
+            QThreadPool.globalInstance().start(lambda: self._fetch_available_models(api_key, api_base))
+
+    def GetAvailableModels(self):
+        """Get the available models, retrieving them now if they have not been prefetched"""
+        models = self.available_models
+        if models is None:
+            api_key = self.options.api_key()
+            models = self._fetch_available_models(api_key, self.options.api_base()) if api_key else []
+        return models
+
+    def _fetch_available_models(self, api_key : str, api_base : str):
+        models = SubtitleTranslator.GetAvailableModels(api_key, api_base)
+        if models:
+            with QMutexLocker(_available_models_mutex):
+                _available_models[_available_models_key(api_key, api_base)] = models
+        return models
+
     def GetLock(self):
         return QMutexLocker(self.mutex)
 
@@ -63,6 +105,7 @@ class ProjectDataModel:
         with QMutexLocker(self.mutex):
             self.viewmodel = ProjectViewModel()
             self.viewmodel.CreateModel(self.project.subtitles)
+            self.viewmodel_changed = True
         return self.viewmodel
 
     def UpdateViewModel(self, update : ModelUpdate):
@@ -1,7 +1,7 @@
 import logging
 logging.basicConfig(encoding='utf-8')
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QTabWidget, QDialogButtonBox, QWidget, QFormLayout, QFrame)
-from GUI.GuiHelpers import GetInstructionFiles, GetThemeNames, LoadInstructionsResource
+from GUI.GuiHelpers import GetInstructionFiles, GetThemeNames, GetInstructionsResource
 
 from GUI.Widgets.OptionsWidgets import CreateOptionWidget
 from PySubtitle.Instructions import Instructions
@@ -41,6 +41,7 @@ class SettingsDialog(QDialog):
             'match_partial_words': (bool, "Used with substitutions, required for some languages where word boundaries aren't detected"),
             'whitespaces_to_newline': (bool, "Convert blocks of whitespace and Chinese Commas to newlines"),
             'max_context_summaries': (int, "Limits the number of scene/batch summaries to include as context with each translation batch"),
+            'max_concurrent_requests': (int, "Send requests for batches in a scene simultaneously. Faster, but batches don't see summaries of earlier batches in the same run"),
             'max_characters': (int, "Validator: Maximum number of characters to allow in a single translated line"),
             'max_newlines': (int, "Validator: Maximum number of newlines to allow in a single translated line"),
             'max_retries': int,
@@ -134,7 +135,7 @@ class SettingsDialog(QDialog):
         instruction_file = self.widgets['instruction_file'].GetValue()
         if instruction_file:
             try:
-                instructions = LoadInstructionsResource(instruction_file)
+                instructions = GetInstructionsResource(instruction_file)
                 self.widgets['gpt_prompt'].SetValue(instructions.prompt)
             except Exception as e:
                 logging.error(f"Unable to load instructions from {instruction_file}: {e}")
\ No newline at end of file
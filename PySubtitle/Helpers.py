@@ -1,4 +1,5 @@
 import datetime
+from functools import lru_cache
 import os
 import logging
 logging.basicConfig(encoding='utf-8')
@@ -208,18 +209,21 @@ def UnbatchScenes(scenes):
     translations = []
     untranslated = []
 
-    for i_scene, scene in enumerate(scenes):
-        for i_batch, batch in enumerate(scene.batches):
-            batch_originals = batch.originals if batch.originals else []
-            batch_translations = batch.translated if batch.translated else []
-            batch_untranslated = batch.untranslated if batch.untranslated else []
-
-            originals.extend(batch_originals)
-            translations.extend(batch_translations)
-            untranslated.extend(batch_untranslated)
+    for batch_originals, batch_translations in UnbatchScenesIter(scenes):
+        originals.extend(batch_originals)
+        translations.extend(batch_translations)
+        untranslated.extend(line for line in batch_originals if not line.translated)
     
     return originals, translations, untranslated
 
+def UnbatchScenesIter(scenes):
+    """
+    Walk the batches in a list of scenes in order, yielding the original and translated lines of each batch
+    """
+    for scene in scenes:
+        for batch in scene.batches:
+            yield batch.originals or [], batch.translated or []
+
 def ResyncTranslatedLines(original_lines, translated_lines):
     """
     Copy number, start and end from original lines to matching translated lines.
@@ -310,12 +314,26 @@ def PerformSubstitutions(substitutions : dict, input, match_partial_words : bool
         return new_list, replacements
 
     result = str(input)
-    for before, after in substitutions.items():
-        pattern = fr"\b{regex.escape(before)}\b" if not match_partial_words else regex.escape(before) 
-        result = regex.sub(pattern, after, result, flags=regex.UNICODE)
-        
+    pattern = _compile_substitutions(tuple(substitutions.keys()), match_partial_words)
+    if pattern:
+        result = pattern.sub(lambda match: substitutions[match.group(0)], result)
+
     return result
 
+@lru_cache(maxsize=16)
+def _compile_substitutions(befores : tuple[str], match_partial_words : bool):
+    """
+    Combine the substitutions into a single pattern so that each line is only scanned once.
+    Longer phrases are listed first so that they take precedence over shorter phrases they contain.
+    """
+    befores = sorted((before for before in befores if before), key=len, reverse=True)
+    if not befores:
+        return None
+
+    alternation = '|'.join(regex.escape(before) for before in befores)
+    pattern = fr"\b(?:{alternation})\b" if not match_partial_words else alternation
+    return regex.compile(pattern, flags=regex.UNICODE)
+
 
 def RemoveWhitespaceAndPunctuation(string):
     # Matches any punctuation, separator, or other Unicode character
@@ -1,6 +1,5 @@
 import logging
 logging.basicConfig(encoding='utf-8')
-import time
 import openai
 
 from PySubtitle.Helpers import ParseDelayFromHeader
@@ -23,15 +22,27 @@ class ChatGPTClient(OpenAIClient):
         """
         options = self.options
         max_retries = options.get('max_retries', 3.0)
-        backoff_time = options.get('backoff_time', 5.0)
         model = options.get('gpt_model')
         temperature = temperature or options.get('temperature', 0.0)
+        # Streamed chat responses don't report token usage, so streaming is opt-in
+        stream = options.get('stream_chat_responses')
 
         translation = {}
         retries = 0
 
         while retries <= max_retries and not self.aborted:
             try:
+                if stream:
+                    response = self.client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        temperature=temperature,
+                        stream=True
+                    )
+
+                    self._read_stream(response, translation)
+                    return translation
+
                 response = self.client.chat.completions.create(
                     model=model,
                     messages=messages,
@@ -60,32 +71,33 @@ class ChatGPTClient(OpenAIClient):
 
                 # Return the response if the API call succeeds
                 return translation
-            
+
+            except TranslationAbortedError:
+                raise
+
             except openai.RateLimitError as e:
                 retry_after = e.response.headers.get('x-ratelimit-reset-requests') or e.response.headers.get('Retry-After')
                 if retry_after:
                     retry_seconds = ParseDelayFromHeader(retry_after)
                     logging.warning(f"Rate limit hit, retrying in {retry_seconds} seconds...")
-                    time.sleep(retry_seconds)
+                    self._sleep(retry_seconds)
                     continue
                 else:
                     logging.warning("Rate limit hit, quota exceeded. Please wait until the quota resets.")
                     raise
 
-            except (openai.APIConnectionError, openai.APITimeoutError) as e:
+            except (openai.APITimeoutError, openai.APIConnectionError, openai.InternalServerError) as e:
                 if self.aborted:
                     raise TranslationAbortedError()
-                
-                if isinstance(e, openai.APIConnectionError):
-                    raise TranslationImpossibleError(str(e), translation)
-                elif retries == max_retries:
+
+                if retries == max_retries:
                     logging.warning(f"OpenAI failure {str(e)}, aborting after {retries} retries...")
                     raise
                 else:
                     retries += 1
-                    sleep_time = backoff_time * 2.0**retries
-                    logging.warning(f"OpenAI error {str(e)}, retrying in {sleep_time}...")
-                    time.sleep(sleep_time)
+                    sleep_time = self._backoff_time(retries)
+                    logging.warning(f"OpenAI error {str(e)}, retrying in {sleep_time:.1f} seconds...")
+                    self._sleep(sleep_time)
                     continue
 
             except Exception as e:
@@ -93,3 +105,63 @@ class ChatGPTClient(OpenAIClient):
 
         return None
 
+    def _read_stream(self, response, translation : dict):
+        """
+        Accumulate a streamed chat completion, checking for an abort request between chunks
+        """
+        text = []
+        for chunk in response:
+            if self.aborted:
+                response.close()
+                raise TranslationAbortedError()
+
+            # Some endpoints report usage in the final chunk
+            usage = getattr(chunk, 'usage', None)
+            if usage:
+                translation['prompt_tokens'] = usage.prompt_tokens
+                translation['completion_tokens'] = usage.completion_tokens
+                translation['total_tokens'] = usage.total_tokens
+
+            # We only expect one choice to be returned as we have 0 temperature
+            if chunk.choices:
+                choice = chunk.choices[0]
+                content = getattr(choice.delta, 'content', None)
+                if content:
+                    text.append(content)
+                if choice.finish_reason:
+                    translation['finish_reason'] = choice.finish_reason
+
+        if not text:
+            raise NoTranslationError("No text returned in the response stream", response)
+
+        translation['text'] = "".join(text)
+
+    def _batch_endpoint(self) -> str:
+        return "/v1/chat/completions"
+
+    def _batch_request_body(self, messages : list) -> dict:
+        return {
+            'model': self.options.get('gpt_model'),
+            'messages': messages,
+            'temperature': self.options.get('temperature', 0.0)
+        }
+
+    def _batch_response_translation(self, body : dict) -> dict:
+        translation = {}
+
+        usage = body.get('usage')
+        if usage:
+            translation['prompt_tokens'] = usage.get('prompt_tokens')
+            translation['completion_tokens'] = usage.get('completion_tokens')
+            translation['total_tokens'] = usage.get('total_tokens')
+
+        # We only expect one choice to be returned as we have 0 temperature
+        choices = body.get('choices')
+        if not choices:
+            raise NoTranslationError("No choices returned in the response", body)
+
+        choice = choices[0]
+        translation['finish_reason'] = choice.get('finish_reason')
+        translation['text'] = (choice.get('message') or {}).get('content')
+
+        return translation
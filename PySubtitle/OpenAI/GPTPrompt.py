@@ -4,16 +4,25 @@ from PySubtitle.Helpers import GenerateTagLines
 
 class GPTPrompt(TranslationPrompt):
     """ Prompt format tailored to OpenAI endpoints """
+    def __init__(self, instructions, system_message : dict = None):
+        super().__init__(instructions)
+        self.system_message = system_message
+
     def GenerateMessages(self, prompt, lines, context):
         if self.instructions:
-            self.messages.append({'role': "system", 'content': self.instructions})
+            self.messages.append(self.system_message or {'role': "system", 'content': self.instructions})
 
         if context:
+            # Context that is the same for every batch goes first, so the prefix can be cached by the endpoint
+            stable_tag_lines = GenerateTagLines(context, ['description', 'names'])
+            if stable_tag_lines:
+                self.messages.append({'role': "user", 'content': f"<context>\n{stable_tag_lines}\n</context>"})
+
             summaries = context.get('summaries')
             if summaries:
                 self.messages.append({'role': "user", 'content': '\n'.join(summaries)})
 
-            tag_lines = GenerateTagLines(context, ['description', 'names','scene', 'summary', 'batch'])
+            tag_lines = GenerateTagLines(context, ['scene', 'summary', 'batch'])
 
             self.user_prompt = self.GenerateBatchPrompt(prompt, lines, tag_lines)
 
@@ -1,6 +1,7 @@
+import io
 import logging
 logging.basicConfig(encoding='utf-8')
-import time
+from functools import lru_cache
 import openai
 
 from PySubtitle.Helpers import ParseDelayFromHeader
@@ -24,9 +25,10 @@ class InstructGPTClient(OpenAIClient):
         options = self.options
         max_tokens = options.get('max_instruct_tokens', 2048)
         max_retries = options.get('max_retries', 3.0)
-        backoff_time = options.get('backoff_time', 5.0)
         model = options.get('gpt_model')
         temperature = temperature or options.get('temperature', 0.0)
+        # Streamed responses don't report token usage, so streaming is opt-in
+        stream = options.get('stream_instruct_responses')
 
         translation = {}
         retries = 0
@@ -35,6 +37,19 @@ class InstructGPTClient(OpenAIClient):
 
         while retries <= max_retries and not self.aborted:
             try:
+                if stream:
+                    response = self.client.completions.create(
+                        model=model,
+                        prompt=prompt,
+                        temperature=temperature,
+                        n=1,
+                        max_tokens=max_tokens,
+                        stream=True
+                    )
+
+                    self._read_stream(response, translation)
+                    return translation
+
                 response = self.client.completions.create(
                     model=model,
                     prompt=prompt,
@@ -48,10 +63,11 @@ class InstructGPTClient(OpenAIClient):
 
                 translation['response_time'] = getattr(response, 'response_ms', 0)
 
-                if response.usage:
-                    translation['prompt_tokens'] = getattr(response.usage, 'prompt_tokens')
-                    translation['completion_tokens'] = getattr(response.usage, 'completion_tokens')
-                    translation['total_tokens'] = getattr(response.usage, 'total_tokens')
+                usage = response.usage
+                if usage:
+                    translation['prompt_tokens'] = usage.prompt_tokens
+                    translation['completion_tokens'] = usage.completion_tokens
+                    translation['total_tokens'] = usage.total_tokens
 
                 # We only expect one choice to be returned as we have 0 temperature
                 if response.choices:
@@ -59,7 +75,7 @@ class InstructGPTClient(OpenAIClient):
                     if not isinstance(choice.text, str):
                         raise NoTranslationError("Instruct model completion text is not a string")
 
-                    translation['finish_reason'] = getattr(choice, 'finish_reason', None)
+                    translation['finish_reason'] = choice.finish_reason
                     translation['text'] = choice.text
                 else:
                     raise NoTranslationError("No choices returned in the response", response)
@@ -67,31 +83,32 @@ class InstructGPTClient(OpenAIClient):
                 # Return the response if the API call succeeds
                 return translation
             
+            except TranslationAbortedError:
+                raise
+
             except openai.RateLimitError as e:
                 retry_after = e.response.headers.get('x-ratelimit-reset-requests') or e.response.headers.get('Retry-After')
                 if retry_after:
                     retry_seconds = ParseDelayFromHeader(retry_after)
                     logging.warning(f"Rate limit hit, retrying in {retry_seconds} seconds...")
-                    time.sleep(retry_seconds)
+                    self._sleep(retry_seconds)
                     continue
                 else:
                     logging.warning("Rate limit hit, quota exceeded. Please wait until the quota resets.")
                     raise
 
-            except (openai.APIConnectionError, openai.APITimeoutError) as e:
+            except (openai.APITimeoutError, openai.APIConnectionError, openai.InternalServerError) as e:
                 if self.aborted:
                     raise TranslationAbortedError()
-                
-                if isinstance(e, openai.APIConnectionError):
-                    raise TranslationImpossibleError(str(e), translation)
-                elif retries == max_retries:
+
+                if retries == max_retries:
                     logging.warning(f"OpenAI failure {str(e)}, aborting after {retries} retries...")
                     raise
                 else:
                     retries += 1
-                    sleep_time = backoff_time * 2.0**retries
-                    logging.warning(f"OpenAI error {str(e)}, retrying in {sleep_time}...")
-                    time.sleep(sleep_time)
+                    sleep_time = self._backoff_time(retries)
+                    logging.warning(f"OpenAI error {str(e)}, retrying in {sleep_time:.1f} seconds...")
+                    self._sleep(sleep_time)
                     continue
 
             except Exception as e:
@@ -99,5 +116,51 @@ class InstructGPTClient(OpenAIClient):
 
         return None
 
+    def _read_stream(self, response, translation : dict):
+        """
+        Accumulate a streamed completion, checking for an abort request between chunks
+        """
+        text = []
+        for chunk in response:
+            if self.aborted:
+                response.close()
+                raise TranslationAbortedError()
+
+            # Some endpoints report usage in the final chunk
+            usage = getattr(chunk, 'usage', None)
+            if usage:
+                translation['prompt_tokens'] = usage.prompt_tokens
+                translation['completion_tokens'] = usage.completion_tokens
+                translation['total_tokens'] = usage.total_tokens
+
+            # We only expect one choice to be returned as we have 0 temperature
+            if chunk.choices:
+                choice = chunk.choices[0]
+                if choice.text:
+                    text.append(choice.text)
+                if choice.finish_reason:
+                    translation['finish_reason'] = choice.finish_reason
+
+        if not text:
+            raise NoTranslationError("No text returned in the response stream", response)
+
+        translation['text'] = "".join(text)
+
     def _build_prompt(self, messages : list):
-        return "\n\n".join([ f"#{m.get('role')} ###\n{m.get('content')}" for m in messages ])
\ No newline at end of file
+        """
+        Combine the messages into a single prompt
+        """
+        return _format_prompt(tuple((message['role'], message['content']) for message in messages))
+
+@lru_cache(maxsize=8)
+def _format_prompt(items : tuple[tuple[str, str]]) -> str:
+    """
+    Format (role, content) pairs as a prompt, memoised so retries of the same batch can reuse it
+    """
+    buffer = io.StringIO()
+    for index, (role, content) in enumerate(items):
+        if index:
+            buffer.write("\n\n")
+        buffer.write(f"#{role} ###\n{content}")
+
+    return buffer.getvalue()
@@ -1,3 +1,4 @@
+import json
 import logging
 logging.basicConfig(encoding='utf-8')
 import openai
@@ -6,6 +7,7 @@ from PySubtitle.Helpers import FormatMessages
 from PySubtitle.OpenAI.GPTPrompt import GPTPrompt
 from PySubtitle.OpenAI.GPTTranslation import GPTTranslation
 from PySubtitle.Options import Options
+from PySubtitle.SubtitleError import TranslationAbortedError, TranslationImpossibleError
 from PySubtitle.TranslationClient import TranslationClient
 from PySubtitle.TranslationParser import TranslationParser
 
@@ -32,11 +34,14 @@ class OpenAIClient(TranslationClient):
 
         self.client = openai.OpenAI(api_key=openai.api_key, base_url=openai.base_url)
 
+        # The instructions are the same for every request, so the system message is only built once
+        self.system_message = {'role': "system", 'content': self.instructions}
+
     def _request_translation(self, prompt, lines, context):
         """
         Generate the prompt and send to OpenAI to request a translation
         """
-        gpt_prompt = GPTPrompt(self.instructions)
+        gpt_prompt = GPTPrompt(self.instructions, self.system_message)
 
         gpt_prompt.GenerateMessages(prompt, lines, context)
 
@@ -48,6 +53,112 @@ class OpenAIClient(TranslationClient):
 
         return translation
     
+    def SupportsBatchAPI(self) -> bool:
+        """
+        The batch API needs an up to date OpenAI library and a client that knows which endpoint to use
+        """
+        return hasattr(self.client, "batches") and self._batch_endpoint() is not None
+
+    def RequestBatchTranslations(self, prompt : str, requests : dict[str, tuple[list, dict]]) -> dict[str, GPTTranslation]:
+        """
+        Upload the requests to the OpenAI batch API, wait for the job to complete and collect the translations
+        """
+        if not hasattr(self.client, "batches"):
+            raise TranslationImpossibleError("The OpenAI library is out of date and must be updated to use the batch API")
+
+        if not self._batch_endpoint():
+            raise TranslationImpossibleError(f"The batch API is not supported for model {self.options.get('gpt_model')}")
+
+        prompts = {}
+        request_lines = []
+        for custom_id, (lines, context) in requests.items():
+            gpt_prompt = GPTPrompt(self.instructions, self.system_message)
+            gpt_prompt.GenerateMessages(prompt, lines, context)
+            prompts[custom_id] = gpt_prompt
+
+            request_lines.append(json.dumps({
+                'custom_id': custom_id,
+                'method': "POST",
+                'url': self._batch_endpoint(),
+                'body': self._batch_request_body(gpt_prompt.messages)
+            }, ensure_ascii=False))
+
+        batch_input = "\n".join(request_lines).encode('utf-8')
+        input_file = self.client.files.create(file=("batch_input.jsonl", batch_input), purpose="batch")
+
+        batch_job = self.client.batches.create(input_file_id=input_file.id, endpoint=self._batch_endpoint(), completion_window="24h")
+        logging.info(f"Submitted {len(requests)} batches to the OpenAI batch API as job {batch_job.id}")
+
+        batch_job = self._wait_for_batch_job(batch_job)
+
+        if batch_job.error_file_id:
+            logging.warning(f"Some requests in job {batch_job.id} failed, see file {batch_job.error_file_id} for details")
+
+        if not batch_job.output_file_id:
+            raise TranslationImpossibleError(f"Batch job {batch_job.id} did not produce any output")
+
+        output = self.client.files.content(batch_job.output_file_id)
+
+        translations = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+
+            result = json.loads(line)
+            custom_id = result.get('custom_id')
+            response = result.get('response')
+
+            if result.get('error') or not response or response.get('status_code') != 200:
+                logging.warning(f"Batch request {custom_id} failed: {result.get('error') or response}")
+                continue
+
+            translation = self._batch_response_translation(response.get('body') or {})
+            translations[custom_id] = GPTTranslation(translation, prompts.get(custom_id))
+
+        return translations
+
+    def _wait_for_batch_job(self, batch_job):
+        """
+        Poll the batch job with exponential backoff until it finishes
+        """
+        poll_time = self.options.get('backoff_time', 5.0)
+        max_poll_time = 300.0
+
+        while batch_job.status not in ('completed', 'failed', 'expired', 'cancelled'):
+            try:
+                self._sleep(poll_time)
+
+            except TranslationAbortedError:
+                logging.warning(f"Stopped waiting for batch job {batch_job.id}, it may still complete on the server")
+                raise
+
+            poll_time = min(poll_time * 2.0, max_poll_time)
+            batch_job = self.client.batches.retrieve(batch_job.id)
+            logging.debug(f"Batch job {batch_job.id} status: {batch_job.status}")
+
+        if batch_job.status != 'completed':
+            raise TranslationImpossibleError(f"Batch job {batch_job.id} {batch_job.status}")
+
+        return batch_job
+
+    def _batch_endpoint(self) -> str:
+        """
+        The API endpoint that batch requests are sent to, or None if the client does not support the batch API
+        """
+        return None
+
+    def _batch_request_body(self, messages : list) -> dict:
+        """
+        The request body for a single translation in a batch job
+        """
+        raise TranslationImpossibleError("This client does not support batch translation")
+
+    def _batch_response_translation(self, body : dict) -> dict:
+        """
+        Extract the translation from the response body of a single request in a batch job
+        """
+        raise TranslationImpossibleError("This client does not support batch translation")
+
     def _abort(self):
         self.client.close()
         return super()._abort()
@@ -43,9 +43,14 @@ default_options = {
     'max_lines': int(os.getenv('MAX_LINES')) if os.getenv('MAX_LINES') else None, 
     'rate_limit': float(os.getenv('RATE_LIMIT')) if os.getenv('RATE_LIMIT') else None,
     'max_threads': int(os.getenv('MAX_THREADS', 4)),
+    'max_concurrent_requests': int(os.getenv('MAX_CONCURRENT_REQUESTS', 1)),
+    'max_concurrent_scenes': int(os.getenv('MAX_CONCURRENT_SCENES', 1)),
+    'use_batch_api': env_bool('USE_BATCH_API', False),
     'max_retries': int(os.getenv('MAX_RETRIES', 5)),
     'backoff_time': float(os.getenv('BACKOFF_TIME', 4.0)),
     'max_instruct_tokens': int(os.getenv('MAX_INSTRUCT_TOKENS', 2048)),
+    'stream_instruct_responses': env_bool('STREAM_INSTRUCT_RESPONSES', False),
+    'stream_chat_responses': env_bool('STREAM_CHAT_RESPONSES', False),
     'project' : os.getenv('PROJECT', None),
     'autosave': env_bool('AUTOSAVE', True),
     'enforce_line_parity': env_bool('ENFORCE_LINE_PARITY', True),
@@ -1,6 +1,8 @@
 import logging
 logging.basicConfig(encoding='utf-8')
 import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from os import linesep
 from PySubtitle.OpenAI.ChatGPTClient import ChatGPTClient
 from PySubtitle.OpenAI.InstructGPTClient import InstructGPTClient
@@ -12,8 +14,8 @@ from PySubtitle.TranslationParser import TranslationParser
 from PySubtitle.Options import Options
 from PySubtitle.SubtitleBatch import SubtitleBatch
 
-from PySubtitle.SubtitleError import TranslationAbortedError, TranslationError, TranslationFailedError, TranslationImpossibleError, UntranslatedLinesError
-from PySubtitle.Helpers import BuildPrompt, Linearise, MergeTranslations, ParseSubstitutions, UnbatchScenes
+from PySubtitle.SubtitleError import NoTranslationError, TranslationAbortedError, TranslationError, TranslationFailedError, TranslationImpossibleError, UntranslatedLinesError
+from PySubtitle.Helpers import BuildPrompt, Linearise, MergeTranslations, ParseSubstitutions, UnbatchScenesIter
 from PySubtitle.SubtitleFile import SubtitleFile
 from PySubtitle.SubtitleScene import SubtitleScene
 from PySubtitle.TranslationEvents import TranslationEvents
@@ -33,16 +35,31 @@ class SubtitleTranslator:
         self.options = options
         self.events = TranslationEvents()
         self.aborted = False
+        self.scene_lock = threading.Lock()
 
         self.prompt = BuildPrompt(options)
 
+        # Compile a single pattern to clean up summaries: a leading scene/batch prefix,
+        # the movie name and any connectors (-,: or whitespace), and the placeholder text from the prompt
+        scene_batch_pattern = r'(?i:(?:Scene|Batch)[\s\d:\-]*)+'
+        movie_name = options.get('movie_name')
+        if movie_name:
+            movie_name_pattern = re.escape(movie_name) + r'\s*[:\-]\s*'
+            leading_pattern = f"^(?:{scene_batch_pattern}(?:{movie_name_pattern})?|{movie_name_pattern})"
+        else:
+            leading_pattern = f"^{scene_batch_pattern}"
+
+        self._sanitise_summary_re = re.compile(f"{leading_pattern}|Summary of the (?:batch|scene)")
+
         logging.debug(f"Translation prompt: {self.prompt}")
  
         # Update subtitle context from options and make our own copy of it
         self.context = subtitles.UpdateContext(options).copy()
+        self.substitutions = ParseSubstitutions(self.context.get('substitutions', {}))
 
-        context_values = [f"{key}: {Linearise(value)}" for key, value in self.context.items()]
-        logging.debug(f"Translation context:\n{linesep.join(context_values)}")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            context_values = [f"{key}: {Linearise(value)}" for key, value in self.context.items()]
+            logging.debug(f"Translation context:\n{linesep.join(context_values)}")
 
         # Initialise the client
         self.client = self._create_client(options, self.context)
@@ -76,57 +93,174 @@ class SubtitleTranslator:
         if not subtitles.scenes:
             raise Exception("No scenes to translate")
         
-        logging.info(f"Translating {subtitles.linecount} lines in {subtitles.scenecount} scenes")
+        scenecount = subtitles.scenecount
+        logging.info(f"Translating {subtitles.linecount} lines in {scenecount} scenes")
 
         self.events.preprocessed(subtitles.scenes)
 
         max_lines = options.get('max_lines')
         remaining_lines = max_lines
+        resume = options.get('resume')
+
+        scenes = subtitles.scenes
+        if resume:
+            scenes = [ scene for scene in scenes if not scene.all_translated ]
+            if len(scenes) < scenecount:
+                logging.info(f"Skipping {scenecount - len(scenes)} scenes that are already translated")
+
+        # Preview and reparse don't send requests, so they don't use the batch API
+        use_batch_api = options.get('use_batch_api') and not (max_lines or options.get('preview') or options.get('reparse'))
+        if use_batch_api and not self.client.SupportsBatchAPI():
+            logging.warning("The batch API is not available for this model, translating batches individually")
+            use_batch_api = False
+
+        if use_batch_api:
+            # Submit all the batches as a single asynchronous job
+            self.TranslateWithBatchAPI(scenes)
+        elif (options.get('max_concurrent_scenes') or 1) > 1 and not (max_lines or options.get('rate_limit')):
+            # Translate several scenes at a time (the rate limit is enforced per request, so this would exceed it)
+            self.TranslateScenesConcurrently(scenes)
+        else:
+            # Iterate over each subtitle scene and request translation
+            for scene in scenes:
+                if self.aborted:
+                    raise TranslationAbortedError()
 
-        # Iterate over each subtitle scene and request translation
-        for scene in subtitles.scenes:
-            if self.aborted:
-                raise TranslationAbortedError()
-
-            if options.get('resume') and scene.all_translated:
-                    logging.info(f"Scene {scene.number} already translated {scene.linecount} lines...")
-                    continue
+                scene_linecount = scene.linecount
 
-            logging.debug(f"Translating scene {scene.number} of {subtitles.scenecount}")
-            batch_numbers = [ batch.number for batch in scene.batches if not batch.translated ] if options.get('resume') else None
+                logging.debug(f"Translating scene {scene.number} of {scenecount}")
+                batch_numbers = [ batch.number for batch in scene.batches if not batch.translated ] if resume else None
 
-            self.TranslateScene(scene, batch_numbers=batch_numbers, remaining_lines=remaining_lines)
+                self.TranslateScene(scene, batch_numbers=batch_numbers, remaining_lines=remaining_lines)
 
-            if remaining_lines:
-                remaining_lines = max(0, remaining_lines - scene.linecount)
-                if not remaining_lines:
-                    logging.info(f"Reached max_lines limit of ({max_lines} lines)... finishing")
-                    break
+                if remaining_lines:
+                    remaining_lines = max(0, remaining_lines - scene_linecount)
+                    if not remaining_lines:
+                        logging.info(f"Reached max_lines limit of ({max_lines} lines)... finishing")
+                        break
 
         # Linearise the translated scenes
-        originals, translations, untranslated = UnbatchScenes(subtitles.scenes)
+        originals = []
+        translations = []
+        for batch_originals, batch_translations in UnbatchScenesIter(subtitles.scenes):
+            originals.extend(batch_originals)
+            translations.extend(batch_translations)
 
         if translations and not max_lines:
             logging.info(f"Successfully translated {len(translations)} lines!")
 
-        if untranslated and not max_lines:
+        untranslated = [ line for line in originals if not line.translated ] if not max_lines else None
+        if untranslated:
             logging.warning(f"Failed to translate {len(untranslated)} lines:")
-            for line in untranslated:
-                logging.info(f"Untranslated > {line.number}. {line.text}")
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                logging.info(linesep.join(f"Untranslated > {line.number}. {line.text}" for line in untranslated))
 
         subtitles.originals = originals
         subtitles.translated = translations
 
+    def TranslateWithBatchAPI(self, scenes : list[SubtitleScene]):
+        """
+        Submit every batch that needs translating to the client's batch API as a single job, then process the results.
+        The job can take a long time to complete, but requests are cheaper and are not subject to the usual rate limits.
+        Batches don't see summaries of earlier batches translated in the same job.
+        """
+        options : Options = self.options
+        client : TranslationClient = self.client
+
+        substitutions = self.substitutions
+        match_partial_words = options.get('match_partial_words')
+        whitespaces_to_newline = options.get('whitespaces_to_newline')
+        max_context_summaries = options.get('max_context_summaries')
+        resume = options.get('resume')
+        retranslate = options.get('retranslate')
+        stop_on_error = options.get('stop_on_error')
+
+        requests = {}
+        pending = []
+
+        for scene in scenes:
+            scene_context = self._get_scene_context(scene)
+
+            for batch in scene.batches:
+                if resume and batch.all_translated:
+                    continue
+
+                originals, _ = self._prepare_batch(batch, substitutions, match_partial_words, whitespaces_to_newline)
+
+                context = {**scene_context, **batch.context} if batch.context and retranslate else scene_context.copy()
+                self._add_batch_context(batch, context, max_context_summaries)
+
+                custom_id = f"scene{scene.number}_batch{batch.number}"
+                requests[custom_id] = (originals, context)
+                pending.append((scene, batch, custom_id, originals, context))
+
+        if not requests:
+            logging.info("No batches need translating")
+            return
+
+        translations : dict[str, Translation] = client.RequestBatchTranslations(self.prompt, requests)
+
+        if self.aborted:
+            raise TranslationAbortedError()
+
+        # The most recent context for each scene, used to update the scene summary
+        scene_contexts : dict[int, tuple[SubtitleScene, dict]] = {}
+
+        for scene, batch, custom_id, originals, context in pending:
+            if self.aborted:
+                raise TranslationAbortedError()
+
+            try:
+                translation = translations.get(custom_id)
+                if translation:
+                    translation = self._check_translation(client, translation, originals)
+
+                self._apply_translation(batch, translation, None, context, client)
+
+            except TranslationAbortedError:
+                raise
+
+            except TranslationError as e:
+                self._handle_batch_error(batch, e, stop_on_error)
+
+            self.events.batch_translated(batch)
+
+            scene_contexts[scene.number] = (scene, context)
+
+        for scene, context in scene_contexts.values():
+            self._scene_translated(scene, context)
+
+    def TranslateScenesConcurrently(self, scenes : list[SubtitleScene]):
+        """
+        Translate scenes on a pool of worker threads.
+        Scenes that are translated at the same time don't see each other's summaries.
+        """
+        options : Options = self.options
+        resume = options.get('resume')
+
+        executor = ThreadPoolExecutor(max_workers=options.get('max_concurrent_scenes'))
+        try:
+            futures = []
+            for scene in scenes:
+                batch_numbers = [ batch.number for batch in scene.batches if not batch.translated ] if resume else None
+                futures.append(executor.submit(self.TranslateScene, scene, batch_numbers=batch_numbers))
+
+            for future in as_completed(futures):
+                if self.aborted:
+                    raise TranslationAbortedError()
+
+                future.result()
+
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def TranslateScene(self, scene : SubtitleScene, batch_numbers = None, line_numbers = None, remaining_lines=None):
         """
         Send a scene for translation
         """
         options : Options = self.options
-        
-        if not scene.context:
-            scene.context = self.context.copy()
-        else:
-            scene.context = {**scene.context, **self.context}
+
+        context = self._get_scene_context(scene)
 
         try:
             if batch_numbers:
@@ -134,16 +268,9 @@ class SubtitleTranslator:
             else:
                 batches = scene.batches
 
-            context = scene.context.copy()
-            context['scene'] = f"Scene {scene.number}: {scene.summary}" if scene.summary else f"Scene {scene.number}"
-
             self.TranslateBatches(self.client, batches, line_numbers, context, remaining_lines)
 
-            # Update the scene summary based on the best available information (we hope)
-            scene.summary = self.SanitiseSummary(scene.summary) or self.SanitiseSummary(context.get('scene')) or self.SanitiseSummary(context.get('summary'))
-
-            # Notify observers the scene was translated
-            self.events.scene_translated(scene)
+            self._scene_translated(scene, context)
 
         except TranslationAbortedError:
             raise
@@ -160,106 +287,250 @@ class SubtitleTranslator:
         """
         options : Options = self.options
 
-        substitutions = ParseSubstitutions(context.get('substitutions', {}))
+        # Only parse the substitutions again if the scene context has its own
+        scene_substitutions = context.get('substitutions', {})
+        if scene_substitutions is self.context.get('substitutions', {}):
+            substitutions = self.substitutions
+        else:
+            substitutions = ParseSubstitutions(scene_substitutions)
         match_partial_words = options.get('match_partial_words')
+        whitespaces_to_newline = options.get('whitespaces_to_newline')
         max_context_summaries = options.get('max_context_summaries')
+        max_concurrent_requests = options.get('max_concurrent_requests') or 1
+        rate_limit = options.get('rate_limit')
+        resume = options.get('resume')
+        retranslate = options.get('retranslate')
+        reparse = options.get('reparse')
+        preview = options.get('preview')
+        stop_on_error = options.get('stop_on_error')
+
+        if resume:
+            pending = [ batch for batch in batches if not batch.all_translated ]
+            if len(pending) < len(batches):
+                logging.info(f"Skipping {len(batches) - len(pending)} batches that are already translated")
+            batches = pending
 
         client = self.client
 
-        for batch in batches:
-            if self.aborted:
-                raise TranslationAbortedError()
+        # Batches that have already been prepared and any translation requests that are in flight
+        prepared : dict[tuple[int, int], tuple[list, dict]] = {}
+        requests : dict[tuple[int, int], tuple[Future, dict]] = {}
+        executor = None
 
-            if options.get('resume') and batch.all_translated:
-                logging.info(f"Scene {batch.scene} batch {batch.number} already translated {batch.size} lines...")
-                continue
+        if max_concurrent_requests > 1 and rate_limit:
+            # The rate limit is enforced per request, so concurrent requests would exceed it
+            logging.debug("Ignoring max_concurrent_requests because a rate limit is set")
 
-            if batch.context and (options.get('retranslate') or options.get('reparse')):
-                # If it's a retranslation, restore context from the batch
-                context = {**context, **batch.context}
+        elif max_concurrent_requests > 1 and not (preview or reparse or remaining_lines):
+            executor = ThreadPoolExecutor(max_workers=max_concurrent_requests)
+            prepared, requests = self._request_concurrent_translations(executor, batches, context, substitutions, match_partial_words, whitespaces_to_newline, max_context_summaries)
 
-            # Apply any substitutions to the input
-            replacements = batch.PerformInputSubstitutions(substitutions, match_partial_words)
+        try:
+            for batch in batches:
+                if self.aborted:
+                    raise TranslationAbortedError()
 
-            # Split single lines with blocks of whitespace
-            if options.get('whitespaces_to_newline'):
-                batch.ConvertWhitespaceBlocksToNewlines()
+                if batch.context and (retranslate or reparse):
+                    # If it's a retranslation, restore context from the batch
+                    context = {**context, **batch.context}
 
-            # Filter out empty lines
-            originals = [line for line in batch.originals if line.text and line.text.strip()]
+                batch_key = (batch.scene, batch.number)
+                if batch_key in prepared:
+                    originals, replacements = prepared[batch_key]
+                else:
+                    originals, replacements = self._prepare_batch(batch, substitutions, match_partial_words, whitespaces_to_newline)
+
+                if remaining_lines and len(originals) > remaining_lines:
+                    logging.info("Truncating batch to remain within max_lines")
+                    originals = originals[:remaining_lines]
+
+                try:
+                    if reparse and batch.translation:
+                        logging.info(f"Reparsing scene {batch.scene} batch {batch.number} with {len(originals)} lines...")
+                        translation = batch.translation
+                    else:
+                        logging.debug(f"Translating scene {batch.scene} batch {batch.number} with {len(originals)} lines...")
+
+                        if replacements and logging.getLogger().isEnabledFor(logging.INFO):
+                            replaced = [f"{Linearise(k)} -> {Linearise(v)}" for k,v in replacements.items()]
+                            logging.info(f"Made substitutions in input:\n{linesep.join(replaced)}")
+
+                        if preview:
+                            self.events.batch_translated(batch)
+                            continue
+
+                        if batch_key in requests:
+                            # Wait for the concurrent request to complete, keeping the context that was sent with it
+                            future, request_context = requests.pop(batch_key)
+                            context.update({ key: request_context.get(key) for key in ('summaries', 'summary', 'batch') })
+                            translation : Translation = future.result()
+                        else:
+                            # Build summaries context
+                            self._add_batch_context(batch, context, max_context_summaries)
+
+                            # Ask the client to do the translation
+                            translation : Translation = self._request_translation(client, originals, context)
+
+                    self._apply_translation(batch, translation, line_numbers, context, client)
+
+                except TranslationAbortedError:
+                    raise
+                    
+                except TranslationError as e:
+                    self._handle_batch_error(batch, e, stop_on_error)
 
-            if remaining_lines and len(originals) > remaining_lines:
-                logging.info("Truncating batch to remain within max_lines")
-                originals = originals[:remaining_lines]
+                if remaining_lines:
+                    remaining_lines = max(0, remaining_lines - len(originals))
+                    if not remaining_lines:
+                        break
 
-            try:
-                if  options.get('reparse') and batch.translation:
-                    logging.info(f"Reparsing scene {batch.scene} batch {batch.number} with {len(originals)} lines...")
-                    translation = batch.translation
-                else:
-                    logging.debug(f"Translating scene {batch.scene} batch {batch.number} with {len(originals)} lines...")
+                context['previous_batch'] = batch
 
-                    if replacements:
-                        replaced = [f"{Linearise(k)} -> {Linearise(v)}" for k,v in replacements.items()]
-                        logging.info(f"Made substitutions in input:\n{linesep.join(replaced)}")
+                # Notify observers the batch was translated
+                self.events.batch_translated(batch)
 
-                    if options.get('preview'):
-                        self.events.batch_translated(batch)
-                        continue
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
 
-                    # Build summaries context
-                    context['summaries'] = self.subtitles.GetBatchContext(batch.scene, batch.number, max_context_summaries)
-                    context['summary'] = batch.summary
-                    context['batch'] = f"Scene {batch.scene} batch {batch.number}"
+    def _prepare_batch(self, batch : SubtitleBatch, substitutions : dict, match_partial_words : bool, whitespaces_to_newline : bool):
+        """
+        Apply input substitutions and formatting to the batch, returning the lines to translate
+        """
+        # Apply any substitutions to the input
+        replacements = batch.PerformInputSubstitutions(substitutions, match_partial_words)
 
-                    # Ask the client to do the translation
-                    translation : Translation = client.RequestTranslation(self.prompt, originals, context)
+        # Split single lines with blocks of whitespace
+        if whitespaces_to_newline:
+            batch.ConvertWhitespaceBlocksToNewlines()
 
-                    if self.aborted:
-                        raise TranslationAbortedError()
+        # Filter out empty lines
+        originals = [line for line in batch.originals if line.text and not line.text.isspace()]
 
-                    if translation.quota_reached:
-                        raise TranslationImpossibleError("OpenAI account quota reached, please upgrade your plan or wait until it renews", translation)
+        return originals, replacements
+
+    def _add_batch_context(self, batch : SubtitleBatch, context : dict, max_context_summaries : int):
+        """
+        Add summaries of previous batches and the batch identity to the context
+        """
+        summaries = self.subtitles.GetBatchContext(batch.scene, batch.number)
+        context['summaries'] = self._compress_summaries(summaries, max_context_summaries)
+        context['summary'] = batch.summary
+        context['batch'] = f"Scene {batch.scene} batch {batch.number}"
 
-                    if translation.reached_token_limit:
-                        # Try again without the context to keep the tokens down
-                        logging.warning("Hit API token limit, retrying batch without context...")
-                        translation = client.RequestTranslation(self.prompt, originals, None)
+    def _compress_summaries(self, summaries : list[str], max_summaries : int) -> list[str]:
+        """
+        Limit the number of summaries sent with a request, keeping the earliest one to establish the setting
+        and the most recent ones, which are most relevant to the batch being translated
+        """
+        if not max_summaries or len(summaries) <= max_summaries:
+            return summaries
 
-                        if translation.reached_token_limit:
-                            raise TranslationError(f"Too many tokens in translation", translation)
+        if max_summaries < 3:
+            return summaries[-max_summaries:]
 
-                if translation:
-                    translation.ParseResponse()
+        return summaries[:1] + summaries[1-max_summaries:]
 
-                    batch.translation = translation
-                    batch.AddContext('summary', context.get('summary'))
-                    batch.AddContext('summaries', context.get('summaries'))
+    def _get_scene_context(self, scene : SubtitleScene) -> dict:
+        """
+        Merge the translation context into the scene's, and return a copy to build on while translating its batches
+        """
+        if not scene.context:
+            scene.context = self.context.copy()
+        else:
+            scene.context = {**scene.context, **self.context}
 
-                    # Process the response
-                    self.ProcessTranslation(batch, line_numbers, context, client)
+        context = scene.context.copy()
+        context['scene'] = f"Scene {scene.number}: {scene.summary}" if scene.summary else f"Scene {scene.number}"
+        return context
 
-                else:
-                    logging.warning(f"No translation for scene {batch.scene} batch {batch.number}")
+    def _scene_translated(self, scene : SubtitleScene, context : dict):
+        """
+        Update the scene summary based on the best available information (we hope) and notify observers
+        """
+        scene.summary = self.SanitiseSummary(scene.summary) or self.SanitiseSummary(context.get('scene')) or self.SanitiseSummary(context.get('summary'))
 
-            except TranslationAbortedError:
-                raise
-                    
-            except TranslationError as e:
-                if options.get('stop_on_error') or isinstance(e, TranslationImpossibleError):
-                    raise TranslationFailedError(f"Failed to translate a batch... terminating", batch.translation, e)
-                else:
-                    logging.warning(f"Error translating batch: {str(e)}")
+        with self.scene_lock:
+            self.events.scene_translated(scene)
+
+    def _apply_translation(self, batch : SubtitleBatch, translation : Translation, line_numbers : list[int], context : dict, client : TranslationClient):
+        """
+        Parse the response to a translation request and apply it to the batch
+        """
+        if not translation:
+            logging.warning(f"No translation for scene {batch.scene} batch {batch.number}")
+            return
 
-            if remaining_lines:
-                remaining_lines = max(0, remaining_lines - len(originals))
-                if not remaining_lines:
-                    break
+        translation.ParseResponse()
 
-            context['previous_batch'] = batch
+        batch.translation = translation
+        batch.AddContext('summary', context.get('summary'))
+        batch.AddContext('summaries', context.get('summaries'))
 
-            # Notify observers the batch was translated
-            self.events.batch_translated(batch)
+        # Process the response
+        self.ProcessTranslation(batch, line_numbers, context, client)
+
+    def _handle_batch_error(self, batch : SubtitleBatch, error : TranslationError, stop_on_error : bool):
+        """
+        Stop translating if the error is fatal or stop_on_error is set, otherwise log it and carry on with the next batch
+        """
+        if stop_on_error or isinstance(error, TranslationImpossibleError):
+            raise TranslationFailedError(f"Failed to translate a batch... terminating", batch.translation, error)
+
+        logging.warning(f"Error translating batch: {str(error)}")
+
+    def _request_translation(self, client : TranslationClient, originals : list, context : dict) -> Translation:
+        """
+        Ask the client to translate the lines
+        """
+        translation : Translation = client.RequestTranslation(self.prompt, originals, context)
+
+        return self._check_translation(client, translation, originals)
+
+    def _check_translation(self, client : TranslationClient, translation : Translation, originals : list) -> Translation:
+        """
+        Check the response can be used, retrying without context if the token limit was reached
+        """
+        if self.aborted:
+            raise TranslationAbortedError()
+
+        if translation.quota_reached:
+            raise TranslationImpossibleError("OpenAI account quota reached, please upgrade your plan or wait until it renews", translation)
+
+        if translation.reached_token_limit:
+            # Try again without the context to keep the tokens down
+            logging.warning("Hit API token limit, retrying batch without context...")
+            translation = client.RequestTranslation(self.prompt, originals, None)
+
+            if translation.reached_token_limit:
+                raise TranslationError(f"Too many tokens in translation", translation)
+
+        return translation
+
+    def _request_concurrent_translations(self, executor : ThreadPoolExecutor, batches : list[SubtitleBatch], context : dict, substitutions : dict, match_partial_words : bool, whitespaces_to_newline : bool, max_context_summaries : int):
+        """
+        Prepare the batches and submit translation requests for all of them at once.
+        Each request only has the context that is available before translation starts,
+        so summaries from earlier batches in the same run are not included.
+        """
+        options : Options = self.options
+        retranslate = options.get('retranslate')
+        prepared = {}
+        requests = {}
+
+        for batch in batches:
+            batch_key = (batch.scene, batch.number)
+            originals, replacements = self._prepare_batch(batch, substitutions, match_partial_words, whitespaces_to_newline)
+            prepared[batch_key] = (originals, replacements)
+
+            batch_context = {**context, **batch.context} if batch.context and retranslate else context.copy()
+            self._add_batch_context(batch, batch_context, max_context_summaries)
+
+            future = executor.submit(self._request_translation, self.client, originals, batch_context)
+            requests[batch_key] = (future, batch_context)
+
+        logging.debug(f"Submitted {len(requests)} concurrent translation requests")
+        return prepared, requests
 
     def ProcessTranslation(self, batch : SubtitleBatch, line_numbers : list[int], context : dict, client : TranslationClient):
         """
@@ -268,11 +539,15 @@ class SubtitleTranslator:
         options : Options = self.options
         substitutions = options.get('substitutions')
         match_partial_words = options.get('match_partial_words')
+        enforce_line_parity = options.get('enforce_line_parity')
+        allow_retranslations = options.get('allow_retranslations')
+        retranslate = options.get('retranslate')
+        stop_on_error = options.get('stop_on_error')
 
         translation : Translation = batch.translation
 
         if not translation.has_translation:
-            raise ValueError("Translation contains no translated text")
+            raise NoTranslationError(f"Scene {batch.scene} batch {batch.number} translation contains no translated text", translation)
         
         logging.debug(f"Scene {batch.scene} batch {batch.number} translation:\n{translation.text}\n")
 
@@ -291,7 +566,7 @@ class SubtitleTranslator:
 
                 if unmatched:
                     logging.warning(f"Unable to match {len(unmatched)} lines with a source line")
-                    if options.get('enforce_line_parity'):
+                    if enforce_line_parity:
                         raise UntranslatedLinesError(f"No translation found for {len(unmatched)} lines", unmatched)
 
                 # Sanity check the results
@@ -301,13 +576,13 @@ class SubtitleTranslator:
                 raise
 
             except TranslationError as e:
-                if not options.get('allow_retranslations'):
+                if not allow_retranslations:
                     raise
                 else:
                     batch.errors.append(e)
 
             # Consider retrying if there were errors
-            if batch.errors and options.get('allow_retranslations') and not self.aborted:
+            if batch.errors and allow_retranslations and not self.aborted:
                 logging.warn(f"Scene {batch.scene} batch {batch.number} failed validation, requesting retranslation")
                 retranslated = self.RequestRetranslations(client, batch, translation)
 
@@ -326,7 +601,7 @@ class SubtitleTranslator:
             # Apply any word/phrase substitutions to the translation 
             replacements = batch.PerformOutputSubstitutions(substitutions, match_partial_words)
 
-            if replacements:
+            if replacements and logging.getLogger().isEnabledFor(logging.INFO):
                 replaced = [f"{k} -> {v}" for k,v in replacements.items()]
                 logging.info(f"Made substitutions in output:\n{linesep.join(replaced)}")
 
@@ -334,7 +609,7 @@ class SubtitleTranslator:
             translation.PerformSubstitutions(substitutions, match_partial_words)
 
             # Update the context, unless it's a retranslation pass
-            if not options.get('retranslate'):
+            if not retranslate:
                 batch.summary = self.SanitiseSummary(translation.summary or batch.summary)
                 scene_summary = self.SanitiseSummary(translation.scene)
 
@@ -350,7 +625,7 @@ class SubtitleTranslator:
                 logging.info(f"Summary: {batch.summary}")
 
         except TranslationError as te:
-            if options.get('stop_on_error'):
+            if stop_on_error:
                 raise
             else:
                 logging.warning(f"Error translating batch: {str(te)}")
@@ -398,14 +673,7 @@ class SubtitleTranslator:
         if not summary:
             return None
 
-        summary = re.sub(r'^(?:(?:Scene|Batch)[\s\d:\-]*)+', '', summary, flags=re.IGNORECASE)
-        summary = summary.replace("Summary of the batch", "")
-        summary = summary.replace("Summary of the scene", "")
-
-        movie_name = self.options.get('movie_name')
-        if movie_name:
-            # Remove movie name and any connectors (-,: or whitespace)
-            summary = re.sub(r'^' + re.escape(movie_name) + r'\s*[:\-]\s*', '', summary)
+        summary = self._sanitise_summary_re.sub('', summary)
 
         return summary.strip() if summary.strip() else None
 
@@ -1,13 +1,16 @@
 import logging
 logging.basicConfig(encoding='utf-8')
+import random
 import time
 
 from PySubtitle.Options import Options
-from PySubtitle.SubtitleError import TranslationAbortedError, TranslationError
+from PySubtitle.SubtitleError import TranslationAbortedError, TranslationError, TranslationImpossibleError
 from PySubtitle.Translation import Translation
 
 linesep = '\n'
 
+max_backoff_time = 120.0
+
 class TranslationClient:
     """
     Handles communication with OpenAI to request translations
@@ -45,7 +48,7 @@ class TranslationClient:
             elapsed_time = time.monotonic() - start_time
             if elapsed_time < minimum_duration:
                 sleep_time = minimum_duration - elapsed_time
-                time.sleep(sleep_time)
+                self._sleep(sleep_time)
 
         return translation
 
@@ -80,6 +83,21 @@ class TranslationClient:
         retranslation = Translation(retranslation_response, prompt)
         return retranslation
     
+    def SupportsBatchAPI(self) -> bool:
+        """
+        Whether the client can submit translation requests as a single asynchronous job
+        """
+        return False
+
+    def RequestBatchTranslations(self, prompt : str, requests : dict[str, tuple[list, dict]]) -> dict[str, Translation]:
+        """
+        Submit a set of translation requests as a single asynchronous job and wait for the results.
+
+        :param requests: maps an identifier for each request to the lines to translate and their context.
+        :return: a Translation for each identifier that was successfully translated.
+        """
+        raise TranslationImpossibleError("This client does not support batch translation")
+
     def AbortTranslation(self):
         self.aborted = True
         self._abort()
@@ -97,6 +115,27 @@ class TranslationClient:
         """
         raise NotImplementedError("Not implemented in the base class")
 
+    def _backoff_time(self, retries : int) -> float:
+        """
+        Exponential backoff with some random jitter, so that concurrent requests don't all retry at once
+        """
+        backoff_time = self.options.get('backoff_time', 5.0)
+        delay = min(backoff_time * 2.0**retries, max_backoff_time)
+        return delay + random.uniform(0, backoff_time)
+
+    def _sleep(self, seconds : float):
+        """
+        Sleep in short increments so that an abort request is noticed promptly
+        """
+        remaining = seconds
+        while remaining > 0 and not self.aborted:
+            interval = min(0.1, remaining)
+            time.sleep(interval)
+            remaining -= interval
+
+        if self.aborted:
+            raise TranslationAbortedError()
+
     def _abort(self):
         # Try to terminate ongoing requests
         pass
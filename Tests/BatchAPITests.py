@@ -0,0 +1,147 @@
+import logging
+logging.basicConfig(encoding='utf-8')
+import os
+from datetime import datetime
+
+from PySubtitle.Options import Options
+from PySubtitle.OpenAI.GPTTranslation import GPTTranslation
+from PySubtitle.SubtitleFile import SubtitleFile
+from PySubtitle.SubtitleLine import SubtitleLine
+from PySubtitle.SubtitleScene import SubtitleScene
+from PySubtitle.SubtitleTranslator import SubtitleTranslator
+from PySubtitle.TranslationClient import TranslationClient
+from PySubtitle.TranslationParser import TranslationParser
+
+def configure_logger(filename, logger_name):
+    """
+    Configures the logger to write to the given filename.
+    Returns the logger instance.
+    """
+    logger = logging.getLogger(logger_name)
+    logger.setLevel(logging.INFO)
+
+    file_handler = logging.FileHandler(filename, mode='w', encoding='utf-8')
+    formatter = logging.Formatter('%(message)s')
+    file_handler.setFormatter(formatter)
+
+    logger.addHandler(file_handler)
+
+    return logger, file_handler
+
+# (scene number, [ (line number, text) ] for each batch)
+test_scenes = [
+    (1, [ [ (1, "Hello"), (2, "Goodbye") ], [ (3, "Yes"), (4, "No") ] ]),
+    (2, [ [ (5, "Left"), (6, "Right") ] ]),
+]
+
+def format_response(lines):
+    return "".join(f"#{number}\nOriginal>\n{text}\nTranslation>\n{text.upper()}\n\n" for number, text in lines)
+
+class StubBatchClient(TranslationClient):
+    """
+    Returns canned batch API results: one empty, one that hit the token limit and the rest translated
+    """
+    def __init__(self, options : Options):
+        super().__init__(options)
+        self.retries = []
+
+    def SupportsBatchAPI(self):
+        return True
+
+    def GetParser(self):
+        return TranslationParser(self.options)
+
+    def RequestBatchTranslations(self, prompt, requests : dict) -> dict:
+        translations = {}
+        for custom_id, (originals, context) in requests.items():
+            lines = [ (line.number, line.text) for line in originals ]
+            if custom_id == "scene1_batch2":
+                translations[custom_id] = GPTTranslation({ 'text': "", 'finish_reason': "stop" }, prompt)
+            elif custom_id == "scene2_batch1":
+                translations[custom_id] = GPTTranslation({ 'text': format_response(lines[:1]), 'finish_reason': "length" }, prompt)
+            else:
+                translations[custom_id] = GPTTranslation({ 'text': format_response(lines), 'finish_reason': "stop" }, prompt)
+        return translations
+
+    def RequestTranslation(self, prompt, lines : list, context : dict):
+        self.retries.append(context)
+        response_lines = [ (line.number, line.text) for line in lines ]
+        return GPTTranslation({ 'text': format_response(response_lines), 'finish_reason': "stop" }, prompt)
+
+def create_subtitles():
+    subtitles = SubtitleFile()
+    scenes = []
+    originals = []
+    for scene_number, batches in test_scenes:
+        scene = SubtitleScene({ 'number': scene_number })
+        for lines in batches:
+            batch = scene.AddNewBatch()
+            for number, text in lines:
+                line = SubtitleLine.Construct(number, f"00:00:{number:02},000", f"00:00:{number:02},500", text)
+                batch.AddLine(line)
+                originals.append(line)
+        scenes.append(scene)
+
+    subtitles.scenes = scenes
+    subtitles.originals = originals
+    return subtitles
+
+def run_batch_api_test(logger):
+    options = Options({
+        'api_key': 'test',
+        'use_batch_api': True,
+        'prompt': "Please translate these subtitles",
+        'instructions': "Translate the subtitles"
+    })
+
+    subtitles = create_subtitles()
+    translator = SubtitleTranslator(subtitles, options)
+    client = StubBatchClient(options)
+    translator.client = client
+
+    translator.TranslateSubtitles()
+
+    if not subtitles.translated:
+        raise Exception("Batch API: no translations were recorded")
+
+    translated = { line.number: line.text for line in subtitles.translated }
+    expected = { 1: "HELLO", 2: "GOODBYE", 5: "LEFT", 6: "RIGHT" }
+    if translated != expected:
+        raise Exception(f"Batch API: expected translations {expected}, got {translated}")
+
+    logger.info("Empty result is skipped and the other batches are translated: OK")
+
+    if client.retries != [ None ]:
+        raise Exception(f"Batch API: expected one retry without context, got {client.retries}")
+
+    logger.info("Result that hit the token limit is retried without context: OK")
+
+def run_tests(directory_path, results_path):
+    result_filepath = os.path.join(results_path, "batch_api_tests.txt")
+    logger, file_handler = configure_logger(result_filepath, "batch_api_tests")
+
+    current_time = datetime.now().strftime("%Y-%m-%d at %H:%M")
+    logger.info(f"Tested: {current_time}")
+    logger.info("".center(60, "-"))
+
+    failures = 0
+    try:
+        try:
+            run_batch_api_test(logger)
+        except Exception as e:
+            logger.error(str(e))
+            failures += 1
+
+        logger.info("".center(60, "-"))
+        logger.info(f"{failures} failures")
+
+    finally:
+        logger.removeHandler(file_handler)
+
+    if failures:
+        raise Exception(f"{failures} batch API tests failed, see {result_filepath}")
+
+if __name__ == "__main__":
+    results_path = os.path.join(os.getcwd(), "test_results")
+    os.makedirs(results_path, exist_ok=True)
+    run_tests(None, results_path)
@@ -0,0 +1,92 @@
+import logging
+logging.basicConfig(encoding='utf-8')
+import os
+from datetime import datetime
+
+from PySubtitle.Options import Options
+from PySubtitle.SubtitleFile import SubtitleFile
+from PySubtitle.SubtitleTranslator import SubtitleTranslator
+
+def configure_logger(filename, logger_name):
+    """
+    Configures the logger to write to the given filename.
+    Returns the logger instance.
+    """
+    logger = logging.getLogger(logger_name)
+    logger.setLevel(logging.INFO)
+
+    file_handler = logging.FileHandler(filename, mode='w', encoding='utf-8')
+    formatter = logging.Formatter('%(message)s')
+    file_handler.setFormatter(formatter)
+
+    logger.addHandler(file_handler)
+
+    return logger, file_handler
+
+# (description, movie_name, summary, expected)
+sanitise_cases = [
+    ("Scene prefix is removed", None, "Scene 1: The crew wake up", "The crew wake up"),
+    ("Batch and scene prefixes are removed", None, "Batch 2 Scene 1 - The crew wake up", "The crew wake up"),
+    ("Prefix matching is case insensitive", None, "SCENE 4: The crew wake up", "The crew wake up"),
+    ("Prefix is only removed at the start", None, "The crew wake up in scene 1", "The crew wake up in scene 1"),
+    ("Placeholder text is removed", None, "The crew wake up. Summary of the scene", "The crew wake up."),
+    ("Placeholder matching is case sensitive", None, "summary of the scene", "summary of the scene"),
+    ("Summary that is only a placeholder is empty", None, "Summary of the batch", None),
+    ("Summary that is only a prefix is empty", None, "Scene 3:", None),
+    ("Movie name alone is removed", "Movie", "Movie: The crew wake up", "The crew wake up"),
+    ("Movie name after a prefix is removed", "Movie", "scene 3: Movie - The crew wake up", "The crew wake up"),
+    ("Movie name matching is case sensitive", "Movie", "movie: The crew wake up", "movie: The crew wake up"),
+    ("Movie name is only removed at the start", "Movie", "The crew of Movie: wake up", "The crew of Movie: wake up"),
+    # The pattern is applied in a single pass, so text exposed by removing a placeholder is not removed
+    ("Movie name after a placeholder is kept", "Movie", "Summary of the batchMovie: ", "Movie:"),
+    ("Placeholder formed by removing another placeholder is kept", None, "Summary of the Summary of the batchscene", "Summary of the scene"),
+    ("Empty summary is None", None, "", None),
+]
+
+def create_translator(movie_name):
+    options = Options({
+        'api_key': 'test',
+        'movie_name': movie_name,
+        'prompt': "Please translate these subtitles",
+        'instructions': "Translate the subtitles"
+    })
+    return SubtitleTranslator(SubtitleFile(), options)
+
+def run_test(logger, description, movie_name, summary, expected):
+    translator = create_translator(movie_name)
+    result = translator.SanitiseSummary(summary)
+    if result != expected:
+        raise Exception(f"{description}: expected {repr(expected)}, got {repr(result)}")
+
+    logger.info(f"{description}: OK")
+
+def run_tests(directory_path, results_path):
+    result_filepath = os.path.join(results_path, "sanitise_summary_tests.txt")
+    logger, file_handler = configure_logger(result_filepath, "sanitise_summary_tests")
+
+    current_time = datetime.now().strftime("%Y-%m-%d at %H:%M")
+    logger.info(f"Tested: {current_time}")
+    logger.info("".center(60, "-"))
+
+    failures = 0
+    try:
+        for description, movie_name, summary, expected in sanitise_cases:
+            try:
+                run_test(logger, description, movie_name, summary, expected)
+            except Exception as e:
+                logger.error(str(e))
+                failures += 1
+
+        logger.info("".center(60, "-"))
+        logger.info(f"{failures} failures")
+
+    finally:
+        logger.removeHandler(file_handler)
+
+    if failures:
+        raise Exception(f"{failures} summary sanitisation tests failed, see {result_filepath}")
+
+if __name__ == "__main__":
+    results_path = os.path.join(os.getcwd(), "test_results")
+    os.makedirs(results_path, exist_ok=True)
+    run_tests(None, results_path)
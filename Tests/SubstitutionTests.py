@@ -0,0 +1,97 @@
+import logging
+logging.basicConfig(encoding='utf-8')
+import os
+from datetime import datetime
+
+from PySubtitle.Helpers import PerformSubstitutions
+
+def configure_logger(filename, logger_name):
+    """
+    Configures the logger to write to the given filename.
+    Returns the logger instance.
+    """
+    logger = logging.getLogger(logger_name)
+    logger.setLevel(logging.INFO)
+
+    file_handler = logging.FileHandler(filename, mode='w', encoding='utf-8')
+    formatter = logging.Formatter('%(message)s')
+    file_handler.setFormatter(formatter)
+
+    logger.addHandler(file_handler)
+
+    return logger, file_handler
+
+# (description, substitutions, input, match_partial_words, expected)
+substitution_cases = [
+    ("Longer keys take precedence over keys they contain", { 'Bob': 'Robert', 'Bobby': 'Rob' }, "Bobby met Bob", False, "Rob met Robert"),
+    ("Precedence does not depend on dictionary order", { 'Bobby': 'Rob', 'Bob': 'Robert' }, "Bob met Bobby", False, "Robert met Rob"),
+    ("Replacements are not rescanned by other substitutions", { 'cat': 'dog', 'dog': 'wolf' }, "cat and dog", False, "dog and wolf"),
+    ("Keys only match whole words by default", { 'cat': 'dog' }, "cat concatenate", False, "dog concatenate"),
+    ("Keys match inside words with match_partial_words", { 'cat': 'dog' }, "cat concatenate", True, "dog condogenate"),
+    ("Non-word-edged keys need a word character after them", { 'Mr.': 'Mister' }, "Mr. Smith and Mr.Jones", False, "Mr. Smith and MisterJones"),
+    ("Non-word-edged keys match anywhere with match_partial_words", { 'Mr.': 'Mister' }, "Mr. Smith", True, "Mister Smith"),
+    ("Replacements are literal text", { 'path': r'C:\temp\1' }, "the path", False, r"the C:\temp\1"),
+    ("Matching is case sensitive", { 'bob': 'Robert' }, "Bob and bob", False, "Bob and Robert"),
+    ("No substitutions leaves the text unchanged", {}, "Bob", False, "Bob"),
+]
+
+def run_test(logger, description, substitutions, text, match_partial_words, expected):
+    result = PerformSubstitutions(substitutions, text, match_partial_words)
+    if result != expected:
+        raise Exception(f"{description}: expected '{expected}', got '{result}'")
+
+    logger.info(f"{description}: OK")
+
+def run_list_test(logger):
+    substitutions = { 'Bob': 'Robert', 'cat': 'dog' }
+    lines = [ "Bob is here", "Nobody", "The cat sat" ]
+
+    new_lines, replacements = PerformSubstitutions(substitutions, lines)
+
+    expected_lines = [ "Robert is here", "Nobody", "The dog sat" ]
+    expected_replacements = { "Bob is here": "Robert is here", "The cat sat": "The dog sat" }
+
+    if new_lines != expected_lines:
+        raise Exception(f"List input: expected lines {expected_lines}, got {new_lines}")
+
+    if replacements != expected_replacements:
+        raise Exception(f"List input: expected replacements {expected_replacements}, got {replacements}")
+
+    logger.info("List input returns the new lines and a dictionary of the lines that changed: OK")
+
+def run_tests(directory_path, results_path):
+    result_filepath = os.path.join(results_path, "substitution_tests.txt")
+    logger, file_handler = configure_logger(result_filepath, "substitution_tests")
+
+    current_time = datetime.now().strftime("%Y-%m-%d at %H:%M")
+    logger.info(f"Tested: {current_time}")
+    logger.info("".center(60, "-"))
+
+    failures = 0
+    try:
+        for description, substitutions, text, match_partial_words, expected in substitution_cases:
+            try:
+                run_test(logger, description, substitutions, text, match_partial_words, expected)
+            except Exception as e:
+                logger.error(str(e))
+                failures += 1
+
+        try:
+            run_list_test(logger)
+        except Exception as e:
+            logger.error(str(e))
+            failures += 1
+
+        logger.info("".center(60, "-"))
+        logger.info(f"{failures} failures")
+
+    finally:
+        logger.removeHandler(file_handler)
+
+    if failures:
+        raise Exception(f"{failures} substitution tests failed, see {result_filepath}")
+
+if __name__ == "__main__":
+    results_path = os.path.join(os.getcwd(), "test_results")
+    os.makedirs(results_path, exist_ok=True)
+    run_tests(None, results_path)